@@ -7,17 +7,15 @@
 # appropriate download for a copy of the license and additional information.
 #
 
+# Fixed pieces of the QueryException and RequestTimeoutException messages.
+_ERROR = 'Error:'
+_TIMEOUT = '  Timeout: '
+_CAUSED_BY = '\nCaused by: '
 
-class IllegalArgumentException(RuntimeError):
-    """
-    Exception class that is used when an invalid argument was passed, this could
-    mean that the type is not the expected or the value is not valid for the
-    specific case.
-    """
 
-    def __init__(self, message=None, cause=None):
-        self._message = message
-        self._cause = cause
+class _CauseMixin(object):
+    # Methods shared by the driver exceptions that hold a message and a cause.
+    __slots__ = ()
 
     def __str__(self):
         return self._message
@@ -32,30 +30,30 @@ class IllegalArgumentException(RuntimeError):
         return self._cause
 
 
-class IllegalStateException(RuntimeError):
+class IllegalArgumentException(_CauseMixin, RuntimeError):
     """
-    Exception that is thrown when a method has been invoked at an illegal or
-    inappropriate time.
+    Exception class that is used when an invalid argument was passed, this could
+    mean that the type is not the expected or the value is not valid for the
+    specific case.
     """
 
     def __init__(self, message=None, cause=None):
         self._message = message
         self._cause = cause
 
-    def __str__(self):
-        return self._message
 
-    def get_cause(self):
-        """
-        Get the cause of the exception.
+class IllegalStateException(_CauseMixin, RuntimeError):
+    """
+    Exception that is thrown when a method has been invoked at an illegal or
+    inappropriate time.
+    """
 
-        :returns: the cause of the exception.
-        :rtype: RuntimeError
-        """
-        return self._cause
+    def __init__(self, message=None, cause=None):
+        self._message = message
+        self._cause = cause
 
 
-class NoSQLException(RuntimeError):
+class NoSQLException(_CauseMixin, RuntimeError):
     """
     A base class for most exceptions thrown by the NoSQL driver.
     """
@@ -64,18 +62,6 @@ class NoSQLException(RuntimeError):
         self._message = message
         self._cause = cause
 
-    def __str__(self):
-        return self._message
-
-    def get_cause(self):
-        """
-        Get the cause of the exception.
-
-        :returns: the cause of the exception.
-        :rtype: RuntimeError
-        """
-        return self._cause
-
     def ok_to_retry(self):
         """
         Returns whether this exception can be retried with a reasonable
@@ -85,7 +71,7 @@ class NoSQLException(RuntimeError):
         return False
 
 
-class QueryException(RuntimeError):
+class QueryException(_CauseMixin, RuntimeError):
     """
     A class to hold query exceptions indicating syntactic or semantic problems
     at the driver side during query execution. It is internal use only and it
@@ -98,12 +84,20 @@ class QueryException(RuntimeError):
         self._message = message
         self._cause = cause
         self._location = location
+        # The string form is built on first use only.
+        self._cached_str = None
 
     def __str__(self):
-        return ('Error:' + ('' if self._location is None else ' at (' +
-                            str(self._location.get_start_line()) + ', ' +
-                            str(self._location.get_start_column()) + ')') +
-                ' ' + self._message)
+        if self._cached_str is None:
+            parts = [_ERROR]
+            if self._location is not None:
+                parts.append(' at ({0}, {1})'.format(
+                    self._location.get_start_line(),
+                    self._location.get_start_column()))
+            parts.append(' ')
+            parts.append(self._message)
+            self._cached_str = ''.join(parts)
+        return self._cached_str
 
     def get_illegal_argument(self):
         # Get this exception as a simple IAE, not wrapped. This is used on the
@@ -120,16 +114,21 @@ class QueryException(RuntimeError):
         Location of an expression in the query. It contains both start and end,
         line and column info.
         """
+        __slots__ = ('_start_line', '_start_column', '_end_line',
+                     '_end_column')
 
         def __init__(self, start_line, start_column, end_line, end_column):
             self._start_line = start_line
             self._start_column = start_column
             self._end_line = end_line
             self._end_column = end_column
-            assert start_line >= 0
-            assert start_column >= 0
-            assert end_line >= 0
-            assert end_column >= 0
+
+        def __reduce__(self):
+            # Slotted objects have no __dict__ to pickle, rebuild from the
+            # constructor arguments instead.
+            return (self.__class__,
+                    (self._start_line, self._start_column, self._end_line,
+                     self._end_column))
 
         def __str__(self):
             return (str(self._start_line) + ':' + str(self._start_column) +
@@ -172,9 +171,6 @@ class InvalidAuthorizationException(NoSQLException):
     string in a request.
     """
 
-    def __init__(self, message):
-        super(InvalidAuthorizationException, self).__init__(message)
-
 
 class OperationNotSupportedException(NoSQLException):
     """
@@ -182,9 +178,6 @@ class OperationNotSupportedException(NoSQLException):
     vs cloud service configurations.
     """
 
-    def __init__(self, message):
-        super(OperationNotSupportedException, self).__init__(message)
-
 
 class RequestTimeoutException(NoSQLException):
     """
@@ -196,16 +189,20 @@ class RequestTimeoutException(NoSQLException):
     def __init__(self, message, timeout_ms=0, cause=None):
         super(RequestTimeoutException, self).__init__(message, cause)
         self._timeout_ms = timeout_ms
+        # The string form is built on first use only.
+        self._cached_str = None
 
     def __str__(self):
-        msg = super(RequestTimeoutException, self).__str__()
-        if self._timeout_ms != 0:
-            msg += '  Timeout: ' + str(self._timeout_ms) + ' ms.'
-        cause = self.get_cause()
-        if cause is not None:
-            msg += ('\nCaused by: ' + cause.__class__.__name__ + ': ' +
-                    str(cause))
-        return msg
+        if self._cached_str is None:
+            parts = [super(RequestTimeoutException, self).__str__()]
+            if self._timeout_ms != 0:
+                parts.extend([_TIMEOUT, str(self._timeout_ms), ' ms.'])
+            cause = self.get_cause()
+            if cause is not None:
+                parts.extend([_CAUSED_BY, cause.__class__.__name__, ': ',
+                              str(cause)])
+            self._cached_str = ''.join(parts)
+        return self._cached_str
 
     def get_timeout_ms(self):
         """
@@ -223,9 +220,6 @@ class ResourceExistsException(NoSQLException):
     The operation attempted to create a resource but it already exists.
     """
 
-    def __init__(self, message):
-        super(ResourceExistsException, self).__init__(message)
-
 
 class ResourceLimitException(NoSQLException):
     """
@@ -236,9 +230,6 @@ class ResourceLimitException(NoSQLException):
     data. It is never thrown directly.
     """
 
-    def __init__(self, message):
-        super(ResourceLimitException, self).__init__(message)
-
 
 class ResourceNotFoundException(NoSQLException):
     """
@@ -246,18 +237,19 @@ class ResourceNotFoundException(NoSQLException):
     in a visible state.
     """
 
-    def __init__(self, message):
-        super(ResourceNotFoundException, self).__init__(message)
-
 
 class RetryableException(NoSQLException):
     """
     A base class for all exceptions that may be retried with a reasonable
     expectation that they may succeed on retry.
     """
+    # Message used when no message is supplied, overridden by subclasses that
+    # have a more specific default message.
+    _DEFAULT_MSG = 'Retryable exception.'
 
-    def __init__(self, message):
-        super(RetryableException, self).__init__(message)
+    def __init__(self, message=None, cause=None):
+        super(RetryableException, self).__init__(
+            message if message is not None else self._DEFAULT_MSG, cause)
 
     def ok_to_retry(self):
         return True
@@ -271,9 +263,6 @@ class TableSizeException(NoSQLException):
     typically require user intervention.
     """
 
-    def __init__(self, message):
-        super(TableSizeException, self).__init__(message)
-
 
 class UnauthorizedException(NoSQLException):
     """
@@ -281,9 +270,6 @@ class UnauthorizedException(NoSQLException):
     permission to perform a request.
     """
 
-    def __init__(self, message):
-        super(UnauthorizedException, self).__init__(message)
-
 
 class IndexExistsException(ResourceExistsException):
     """
@@ -291,9 +277,6 @@ class IndexExistsException(ResourceExistsException):
     already exists.
     """
 
-    def __init__(self, message):
-        super(IndexExistsException, self).__init__(message)
-
 
 class TableExistsException(ResourceExistsException):
     """
@@ -301,9 +284,6 @@ class TableExistsException(ResourceExistsException):
     exists.
     """
 
-    def __init__(self, message):
-        super(TableExistsException, self).__init__(message)
-
 
 class EvolutionLimitException(ResourceLimitException):
     """
@@ -313,9 +293,6 @@ class EvolutionLimitException(ResourceLimitException):
     table more times than allowed by the system defined limit.
     """
 
-    def __init__(self, message):
-        super(EvolutionLimitException, self).__init__(message)
-
 
 class DeploymentException(ResourceLimitException):
     """
@@ -327,9 +304,6 @@ class DeploymentException(ResourceLimitException):
     tenant. These are system-defined limits.
     """
 
-    def __init__(self, message):
-        super(DeploymentException, self).__init__(message)
-
 
 class IndexLimitException(ResourceLimitException):
     """
@@ -339,9 +313,6 @@ class IndexLimitException(ResourceLimitException):
     table than the system defined limit.
     """
 
-    def __init__(self, message):
-        super(IndexLimitException, self).__init__(message)
-
 
 class KeySizeLimitException(ResourceLimitException):
     """
@@ -351,9 +322,6 @@ class KeySizeLimitException(ResourceLimitException):
     primary key or index key size that exceeds the system defined limit.
     """
 
-    def __init__(self, message):
-        super(KeySizeLimitException, self).__init__(message)
-
 
 class RowSizeLimitException(ResourceLimitException):
     """
@@ -363,9 +331,6 @@ class RowSizeLimitException(ResourceLimitException):
     that exceeds the system defined limit.
     """
 
-    def __init__(self, message):
-        super(RowSizeLimitException, self).__init__(message)
-
 
 class TableLimitException(ResourceLimitException):
     """
@@ -375,9 +340,6 @@ class TableLimitException(ResourceLimitException):
     tables that exceeds the system defined limit.
     """
 
-    def __init__(self, message):
-        super(TableLimitException, self).__init__(message)
-
 
 class BatchOperationNumberLimitException(ResourceLimitException):
     """
@@ -388,9 +350,6 @@ class BatchOperationNumberLimitException(ResourceLimitException):
     limit.
     """
 
-    def __init__(self, message):
-        super(BatchOperationNumberLimitException, self).__init__(message)
-
 
 class RequestSizeLimitException(ResourceLimitException):
     """
@@ -400,9 +359,6 @@ class RequestSizeLimitException(ResourceLimitException):
     limit.
     """
 
-    def __init__(self, message):
-        super(RequestSizeLimitException, self).__init__(message)
-
 
 class IndexNotFoundException(ResourceNotFoundException):
     """
@@ -410,9 +366,6 @@ class IndexNotFoundException(ResourceNotFoundException):
     a visible state.
     """
 
-    def __init__(self, message):
-        super(IndexNotFoundException, self).__init__(message)
-
 
 class TableNotFoundException(ResourceNotFoundException):
     """
@@ -420,9 +373,6 @@ class TableNotFoundException(ResourceNotFoundException):
     a visible state.
     """
 
-    def __init__(self, message):
-        super(TableNotFoundException, self).__init__(message)
-
 
 class SecurityInfoNotReadyException(RetryableException):
     """
@@ -432,9 +382,7 @@ class SecurityInfoNotReadyException(RetryableException):
     system. This exception will occur as the system acquires security
     information and must be retried in order for authorization to work properly.
     """
-
-    def __init__(self, message):
-        super(SecurityInfoNotReadyException, self).__init__(message)
+    _DEFAULT_MSG = 'Security information is not ready.'
 
 
 class SystemException(RetryableException):
@@ -442,9 +390,7 @@ class SystemException(RetryableException):
     An exception that is thrown when there is an internal system problem.
     Most system problems are temporary, so this is a retryable exception.
     """
-
-    def __init__(self, message):
-        super(SystemException, self).__init__(message)
+    _DEFAULT_MSG = 'Internal system problem.'
 
 
 class TableBusyException(RetryableException):
@@ -453,9 +399,7 @@ class TableBusyException(RetryableException):
     is in use or busy. Only one modification operation at a time is allowed on
     a table.
     """
-
-    def __init__(self, message):
-        super(TableBusyException, self).__init__(message)
+    _DEFAULT_MSG = 'Table is busy.'
 
 
 class ThrottlingException(RetryableException):
@@ -473,9 +417,7 @@ class ThrottlingException(RetryableException):
     It is recommended that applications use rate limiting to avoid these
     exceptions.
     """
-
-    def __init__(self, message):
-        super(ThrottlingException, self).__init__(message)
+    _DEFAULT_MSG = 'Throughput or operation limit exceeded.'
 
 
 class OperationThrottlingException(ThrottlingException):
@@ -492,9 +434,7 @@ class OperationThrottlingException(ThrottlingException):
     that callers use a relatively large delay before retrying in order to
     minimize the chance that a retry will also be throttled.
     """
-
-    def __init__(self, message):
-        super(OperationThrottlingException, self).__init__(message)
+    _DEFAULT_MSG = 'Operation limit exceeded.'
 
 
 class ReadThrottlingException(ThrottlingException):
@@ -509,9 +449,7 @@ class ReadThrottlingException(ThrottlingException):
     that a retry will also be throttled. Applications should attempt to avoid
     throttling exceptions by rate limiting themselves to the degree possible.
     """
-
-    def __init__(self, message):
-        super(ReadThrottlingException, self).__init__(message)
+    _DEFAULT_MSG = 'Read throughput limit exceeded.'
 
 
 class WriteThrottlingException(ThrottlingException):
@@ -526,6 +464,4 @@ class WriteThrottlingException(ThrottlingException):
     that a retry will also be throttled. Applications should attempt to avoid
     throttling exceptions by rate limiting themselves to the degree possible.
     """
-
-    def __init__(self, message):
-        super(WriteThrottlingException, self).__init__(message)
+    _DEFAULT_MSG = 'Write throughput limit exceeded.'
@@ -234,7 +234,8 @@ class RequestUtils(object):
                     'Unexpected authentication exception: ' + str(ae))
                 raise NoSQLException('Unexpected exception: ' + str(ae), ae)
             except RetryableException as re:
-                self._logutils.log_debug('Retryable exception: ' + str(re))
+                if self._logutils.is_enabled_for(DEBUG):
+                    self._logutils.log_debug('Retryable exception: ' + str(re))
                 """
                 Handle automatic retries. If this does not throw an error, then
                 the delay (if any) will have been performed and the request
@@ -287,9 +288,11 @@ class RequestUtils(object):
 
     def _handle_retry(self, re, request, throttle_retried):
         throttle_retried += 1
-        msg = ('Retry for request ' + request.__class__.__name__ + ', num ' +
-               'retries: ' + str(throttle_retried) + ', exception: ' + str(re))
-        self._logutils.log_debug(msg)
+        if self._logutils.is_enabled_for(DEBUG):
+            self._logutils.log_debug(
+                'Retry for request ' + request.__class__.__name__ +
+                ', num retries: ' + str(throttle_retried) + ', exception: ' +
+                str(re))
         handler = self._retry_handler
         if not handler.do_retry(request, throttle_retried, re):
             self._logutils.log_debug(
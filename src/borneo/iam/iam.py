@@ -9,7 +9,7 @@
 
 from os import path
 from requests import Request, Session
-from threading import Timer
+from threading import Event, Timer
 try:
     import oci
 except ImportError:
@@ -208,6 +208,8 @@ class SignatureProvider(AuthorizationProvider):
 
         # Refresh timer.
         self._timer = None
+        # Set each time the refresh task caches a new signature.
+        self._refreshed = Event()
         self._service_url = None
         self._logger = None
         self._logutils = LogUtils()
@@ -370,6 +372,7 @@ class SignatureProvider(AuthorizationProvider):
             if sig_details is not None:
                 self._signature_cache.set(SignatureProvider.CACHE_KEY,
                                           sig_details)
+                self._refreshed.set()
                 self._schedule_refresh()
         except Exception as e:
             # Ignore the failure of refresh. The driver would try to generate
@@ -544,7 +544,7 @@ class ArithOpIter(PlanIter):
                 raise QueryException(
                     'Operand in arithmetic operation has illegal type\n' +
                     'Operand : ' + str(i) + ' type :\n' + str(type(arg_val)),
-                    self.get_location())
+                    location=self.get_location())
         if res_type == serde.BinaryProtocol.FIELD_VALUE_TYPE.DOUBLE:
             res = float(self._init_result)
         elif res_type == serde.BinaryProtocol.FIELD_VALUE_TYPE.INTEGER:
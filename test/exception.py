@@ -0,0 +1,84 @@
+#
+# Copyright (C) 2018, 2020 Oracle and/or its affiliates. All rights reserved.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl
+#
+# Please see LICENSE.txt file included in the top-level directory of the
+# appropriate download for a copy of the license and additional information.
+#
+
+import pickle
+import unittest
+from copy import copy
+
+from borneo import (
+    IllegalArgumentException, InvalidAuthorizationException, NoSQLException,
+    RequestTimeoutException, RetryableException)
+from borneo.exception import QueryException
+from borneo.serde import BinaryProtocol
+
+
+class TestException(unittest.TestCase):
+
+    def testExceptionPickleAndCopy(self):
+        cause = ValueError('cause')
+        location = QueryException.Location(1, 2, 3, 4)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            query_exception = pickle.loads(pickle.dumps(
+                QueryException('bad', location=location), protocol))
+            self.assertEqual(str(query_exception), 'Error: at (1, 2) bad')
+            self.assertEqual(str(query_exception.get_location()), '1:2-3:4')
+            timeout_exception = pickle.loads(pickle.dumps(
+                RequestTimeoutException('msg', 5, cause), protocol))
+            self.assertEqual(
+                str(timeout_exception),
+                'msg  Timeout: 5 ms.\nCaused by: ValueError: cause')
+        exception = copy(NoSQLException('msg', cause))
+        self.assertEqual(str(exception), 'msg')
+        self.assertIs(exception.get_cause(), cause)
+        self.assertEqual(str(copy(location)), '1:2-3:4')
+
+    def testExceptionDefaultMessage(self):
+        codes = [BinaryProtocol.SERVER_RETRY_ERROR.SECURITY_INFO_UNAVAILABLE,
+                 BinaryProtocol.SERVER_RETRY_ERROR.SERVICE_UNAVAILABLE,
+                 BinaryProtocol.SERVER_RETRY_ERROR.SERVER_ERROR,
+                 BinaryProtocol.SERVER_RETRY_ERROR.TABLE_BUSY,
+                 BinaryProtocol.THROTTLING_ERROR.OPERATION_LIMIT_EXCEEDED,
+                 BinaryProtocol.THROTTLING_ERROR.READ_LIMIT_EXCEEDED,
+                 BinaryProtocol.THROTTLING_ERROR.WRITE_LIMIT_EXCEEDED]
+        for code in codes:
+            exception = BinaryProtocol.map_exception(code, None)
+            self.assertIsInstance(exception, RetryableException)
+            self.assertTrue(len(str(exception)) > 0)
+        self.assertEqual(str(RetryableException('msg')), 'msg')
+        # Exceptions without a default message still require one.
+        self.assertRaises(TypeError, InvalidAuthorizationException)
+        self.assertRaises(TypeError, NoSQLException)
+
+    def testQueryExceptionGetIllegalArgument(self):
+        location = QueryException.Location(3, 7, 3, 12)
+        exception = QueryException('Illegal operand', location=location)
+        self.assertIs(exception.get_location(), location)
+        self.assertIsNone(exception.get_cause())
+        try:
+            exception.get_illegal_argument()
+            self.fail('IllegalArgumentException not raised')
+        except IllegalArgumentException as iae:
+            self.assertEqual(str(iae), 'Error: at (3, 7) Illegal operand')
+        # Without a location only the message is included.
+        self.assertRaises(IllegalArgumentException,
+                          QueryException('msg').get_illegal_argument)
+        self.assertEqual(str(QueryException('msg')), 'Error: msg')
+
+    def testExceptionMultipleInheritance(self):
+        class IllegalArgumentNoSQLException(IllegalArgumentException,
+                                            NoSQLException):
+            pass
+
+        exception = IllegalArgumentNoSQLException('msg')
+        self.assertEqual(str(exception), 'msg')
+        self.assertIsNone(exception.get_cause())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,6 @@
 
 import unittest
 from os import path, remove
-from time import sleep
 try:
     import oci
     found = True
@@ -23,233 +22,238 @@ from borneo.iam import SignatureProvider
 from parameters import iam_principal
 from testutils import fake_credentials_file, fake_key_file
 
+# Content of the generated credentials file.
+_CRED_BODY = ('[DEFAULT]\n' +
+              'tenancy=ocid1.tenancy.oc1..tenancy\n' +
+              'user=ocid1.user.oc1..user\n' +
+              'fingerprint=fingerprint\n' +
+              'key_file=' + fake_key_file + '\n' +
+              'region=us-ashburn-1\n')
 
+# Arguments of SignatureProvider that should raise IllegalArgumentException.
+_ILLEGAL_INIT_CASES = [
+    # illegal provider
+    (('IllegalProvider',), {}),
+    # illegal config_file
+    ((), {'config_file': {'config_file': fake_credentials_file}}),
+    # illegal profile_name
+    ((), {'profile_name': {'profile_name': 'DEFAULT'}}),
+    # illegal tenant_id
+    ((), {'tenant_id': {}, 'user_id': 'user', 'fingerprint': 'fingerprint',
+          'private_key': 'key'}),
+    ((), {'tenant_id': '', 'user_id': 'user', 'fingerprint': 'fingerprint',
+          'private_key': 'key'}),
+    # illegal user_id
+    ((), {'tenant_id': 'tenant', 'user_id': {}, 'fingerprint': 'fingerprint',
+          'private_key': 'key'}),
+    ((), {'tenant_id': 'tenant', 'user_id': '', 'fingerprint': 'fingerprint',
+          'private_key': 'key'}),
+    # illegal fingerprint
+    ((), {'tenant_id': 'tenant', 'user_id': 'user', 'fingerprint': {},
+          'private_key': 'key'}),
+    ((), {'tenant_id': 'tenant', 'user_id': 'user', 'fingerprint': '',
+          'private_key': 'key'}),
+    # illegal private_key
+    ((), {'tenant_id': 'tenant', 'user_id': 'user',
+          'fingerprint': 'fingerprint', 'private_key': {}}),
+    ((), {'tenant_id': 'tenant', 'user_id': 'user',
+          'fingerprint': 'fingerprint', 'private_key': ''}),
+    # illegal pass phrase
+    ((), {'tenant_id': 'tenant', 'user_id': 'user',
+          'fingerprint': 'fingerprint', 'private_key': 'key',
+          'pass_phrase': {}}),
+    ((), {'tenant_id': 'tenant', 'user_id': 'user',
+          'fingerprint': 'fingerprint', 'private_key': 'key',
+          'pass_phrase': ''}),
+    # illegal region
+    ((), {'tenant_id': 'tenant', 'user_id': 'user',
+          'fingerprint': 'fingerprint', 'private_key': 'key',
+          'pass_phrase': {}, 'region': 'IllegalRegion'}),
+    # illegal cache duration seconds
+    ((), {'duration_seconds': 'IllegalDurationSeconds'}),
+    ((), {'duration_seconds': 0}),
+    ((), {'duration_seconds': -1}),
+    ((), {'duration_seconds': 301}),
+    # illegal refresh ahead
+    ((), {'refresh_ahead': 'IllegalRefreshAhead'}),
+    ((), {'refresh_ahead': 0}),
+    ((), {'refresh_ahead': -1})]
+
+
+@unittest.skipUnless(found, 'oci SDK not installed')
 class TestSignatureProvider(unittest.TestCase):
-    if found:
-        def setUp(self):
-            self.base = 'http://localhost:' + str(8000)
-            self._generate_credentials_file()
+    @classmethod
+    def setUpClass(cls):
+        # The credentials file is only read by the tests, generate it once.
+        cls._generate_credentials_file()
+        cls.handle_config = NoSQLHandleConfig(
+            'http://localhost:' + str(8000))
+
+    @classmethod
+    def tearDownClass(cls):
+        remove(fake_credentials_file)
+
+    def setUp(self):
+        self.token_provider = None
+        # Not matter which request.
+        self.request = TableRequest()
+
+    def tearDown(self):
+        if self.token_provider is not None:
+            self.token_provider.close()
             self.token_provider = None
-            # Not matter which request.
-            self.request = TableRequest()
-            self.handle_config = NoSQLHandleConfig(self.base)
 
-        def tearDown(self):
-            remove(fake_credentials_file)
-            if self.token_provider is not None:
-                self.token_provider.close()
-                self.token_provider = None
+    def testAccessTokenProviderIllegalInit(self):
+        # Check every case and report all the ones that did not raise
+        # IllegalArgumentException, together with their arguments.
+        failed = []
+        for args, kwargs in _ILLEGAL_INIT_CASES:
+            try:
+                SignatureProvider(*args, **kwargs).close()
+                failed.append((args, kwargs, 'no exception raised'))
+            except IllegalArgumentException:
+                pass
+            except Exception as e:
+                failed.append((args, kwargs, repr(e)))
+        self.assertEqual(failed, [])
 
-        def testAccessTokenProviderIllegalInit(self):
-            # illegal provider
-            self.assertRaises(IllegalArgumentException, SignatureProvider,
-                              'IllegalProvider')
-            # illegal config_file
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider,
-                config_file={'config_file': fake_credentials_file})
-            # illegal profile_name
-            self.assertRaises(IllegalArgumentException, SignatureProvider,
-                              profile_name={'profile_name': 'DEFAULT'})
-            # illegal tenant_id
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id={},
-                user_id='user', fingerprint='fingerprint', private_key='key')
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='',
-                user_id='user', fingerprint='fingerprint', private_key='key')
-            # illegal user_id
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='tenant',
-                user_id={}, fingerprint='fingerprint', private_key='key')
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='tenant',
-                user_id='', fingerprint='fingerprint', private_key='key')
-            # illegal fingerprint
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='tenant',
-                user_id='user', fingerprint={}, private_key='key')
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='tenant',
-                user_id='user', fingerprint='', private_key='key')
-            # illegal private_key
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='tenant',
-                user_id='user', fingerprint='fingerprint', private_key={})
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='tenant',
-                user_id='user', fingerprint='fingerprint', private_key='')
-            # illegal pass phrase
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='tenant',
-                user_id='user', fingerprint='fingerprint', private_key='key',
-                pass_phrase={})
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='tenant',
-                user_id='user', fingerprint='fingerprint', private_key='key',
-                pass_phrase='')
-            # illegal region
-            self.assertRaises(
-                IllegalArgumentException, SignatureProvider, tenant_id='tenant',
-                user_id='user', fingerprint='fingerprint', private_key='key',
-                pass_phrase={}, region='IllegalRegion')
+    def testAccessTokenProviderSetIllegalLogger(self):
+        self.token_provider = SignatureProvider(
+            config_file=fake_credentials_file)
+        self.assertRaises(IllegalArgumentException,
+                          self.token_provider.set_logger, 'IllegalLogger')
 
-            # illegal cache duration seconds
-            self.assertRaises(IllegalArgumentException, SignatureProvider,
-                              duration_seconds='IllegalDurationSeconds')
-            self.assertRaises(IllegalArgumentException, SignatureProvider,
-                              duration_seconds=0)
-            self.assertRaises(IllegalArgumentException, SignatureProvider,
-                              duration_seconds=-1)
-            self.assertRaises(IllegalArgumentException, SignatureProvider,
-                              duration_seconds=301)
-            # illegal refresh ahead
-            self.assertRaises(IllegalArgumentException, SignatureProvider,
-                              refresh_ahead='IllegalRefreshAhead')
-            self.assertRaises(IllegalArgumentException, SignatureProvider,
-                              refresh_ahead=0)
-            self.assertRaises(IllegalArgumentException, SignatureProvider,
-                              refresh_ahead=-1)
+    def testAccessTokenProviderGetAuthStringWithIllegalRequest(self):
+        config = oci.config.from_file(file_location=fake_credentials_file)
+        provider = oci.signer.Signer(
+            config['tenancy'], config['user'], config['fingerprint'],
+            config['key_file'], config.get('pass_phrase'),
+            config.get('key_content'))
+        self.token_provider = SignatureProvider(provider)
+        self.assertRaises(IllegalArgumentException,
+                          self.token_provider.get_authorization_string,
+                          'IllegalRequest')
 
-        def testAccessTokenProviderSetIllegalLogger(self):
-            self.token_provider = SignatureProvider(
-                config_file=fake_credentials_file)
-            self.assertRaises(IllegalArgumentException,
-                              self.token_provider.set_logger, 'IllegalLogger')
+    def testAccessTokenProviderGets(self):
+        self.token_provider = SignatureProvider(
+            config_file=fake_credentials_file)
+        self.assertIsNone(self.token_provider.get_logger())
 
-        def testAccessTokenProviderGetAuthStringWithIllegalRequest(self):
-            config = oci.config.from_file(file_location=fake_credentials_file)
-            provider = oci.signer.Signer(
-                config['tenancy'], config['user'], config['fingerprint'],
-                config['key_file'], config.get('pass_phrase'),
-                config.get('key_content'))
-            self.token_provider = SignatureProvider(provider)
-            self.assertRaises(IllegalArgumentException,
-                              self.token_provider.get_authorization_string,
-                              'IllegalRequest')
+    def testAccessTokenProviderGetAuthStringWithConfigFile(self):
+        self.token_provider = SignatureProvider(
+            config_file=fake_credentials_file, duration_seconds=2,
+            refresh_ahead=1)
+        self.assertRaises(
+            IllegalArgumentException,
+            self.token_provider.get_authorization_string, self.request)
+        self.token_provider.set_service_url(self.handle_config)
+        auth_string = self.token_provider.get_authorization_string(
+            self.request)
+        # Cache duration is about 2s, string should be the same.
+        self.assertEqual(
+            auth_string,
+            self.token_provider.get_authorization_string(self.request))
+        # Wait for the refresh to complete.
+        self.assertTrue(self.token_provider._refreshed.wait(10))
+        self.token_provider._refreshed.clear()
+        # The new signature string should be cached.
+        self.assertNotEqual(
+            auth_string,
+            self.token_provider.get_authorization_string(self.request))
 
-        def testAccessTokenProviderGets(self):
-            self.token_provider = SignatureProvider(
-                config_file=fake_credentials_file)
-            self.assertIsNone(self.token_provider.get_logger())
+    def testAccessTokenProviderGetAuthStringWithoutConfigFile(self):
+        self.token_provider = SignatureProvider(
+            tenant_id='ocid1.tenancy.oc1..tenancy',
+            user_id='ocid1.user.oc1..user', fingerprint='fingerprint',
+            private_key=fake_key_file, duration_seconds=2, refresh_ahead=1)
+        self.assertRaises(
+            IllegalArgumentException,
+            self.token_provider.get_authorization_string, self.request)
+        self.token_provider.set_service_url(self.handle_config)
+        auth_string = self.token_provider.get_authorization_string(
+            self.request)
+        # Cache duration is about 2s, string should be the same.
+        self.assertEqual(
+            auth_string,
+            self.token_provider.get_authorization_string(self.request))
+        # Wait for the refresh to complete.
+        self.assertTrue(self.token_provider._refreshed.wait(10))
+        self.token_provider._refreshed.clear()
+        # The new signature string should be cached.
+        self.assertNotEqual(
+            auth_string,
+            self.token_provider.get_authorization_string(self.request))
 
-        def testAccessTokenProviderGetAuthStringWithConfigFile(self):
-            self.token_provider = SignatureProvider(
-                config_file=fake_credentials_file, duration_seconds=5,
-                refresh_ahead=1)
-            self.assertRaises(
-                IllegalArgumentException,
-                self.token_provider.get_authorization_string, self.request)
-            self.token_provider.set_service_url(self.handle_config)
-            auth_string = self.token_provider.get_authorization_string(
-                self.request)
-            # Cache duration is about 5s, string should be the same.
-            self.assertEqual(
-                auth_string,
-                self.token_provider.get_authorization_string(self.request))
-            # Wait for the refresh to complete.
-            sleep(5)
-            # The new signature string should be cached.
-            self.assertNotEqual(
-                auth_string,
-                self.token_provider.get_authorization_string(self.request))
+    def testAccessTokenProviderGetRegion(self):
+        # no region
+        config = oci.config.from_file(file_location=fake_credentials_file)
+        provider = oci.signer.Signer(
+            config['tenancy'], config['user'], config['fingerprint'],
+            config['key_file'], config.get('pass_phrase'),
+            config.get('key_content'))
+        self.token_provider = SignatureProvider(provider)
+        self.assertIsNone(self.token_provider.get_region())
+        self.token_provider.close()
+        # region get from provider parameter of constructor
+        provider.region = config['region']
+        self.token_provider = SignatureProvider(provider)
+        self.assertEqual(self.token_provider.get_region(),
+                         Regions.US_ASHBURN_1)
+        self.token_provider.close()
+        # region get from config_file parameter of constructor
+        self.token_provider = SignatureProvider(
+            config_file=fake_credentials_file)
+        self.assertEqual(self.token_provider.get_region(),
+                         Regions.US_ASHBURN_1)
+        self.token_provider.close()
+        # region from region parameter of constructor
+        self.token_provider = SignatureProvider(
+            tenant_id='ocid1.tenancy.oc1..tenancy',
+            user_id='ocid1.user.oc1..user', fingerprint='fingerprint',
+            private_key=fake_key_file, region=Regions.US_ASHBURN_1,
+            duration_seconds=5, refresh_ahead=1)
+        self.assertEqual(self.token_provider.get_region(),
+                         Regions.US_ASHBURN_1)
 
-        def testAccessTokenProviderGetAuthStringWithoutConfigFile(self):
+    if iam_principal() == 'instance principal':
+        def testInstancePrincipalGetAuthString(self):
+            signer = (
+                oci.auth.signers.InstancePrincipalsSecurityTokenSigner())
             self.token_provider = SignatureProvider(
-                tenant_id='ocid1.tenancy.oc1..tenancy',
-                user_id='ocid1.user.oc1..user', fingerprint='fingerprint',
-                private_key=fake_key_file, duration_seconds=5, refresh_ahead=1)
+                signer, duration_seconds=2, refresh_ahead=1)
             self.assertRaises(
                 IllegalArgumentException,
                 self.token_provider.get_authorization_string, self.request)
             self.token_provider.set_service_url(self.handle_config)
             auth_string = self.token_provider.get_authorization_string(
                 self.request)
-            # Cache duration is about 5s, string should be the same.
+            # Cache duration is about 2s, string should be the same.
             self.assertEqual(
                 auth_string,
                 self.token_provider.get_authorization_string(self.request))
             # Wait for the refresh to complete.
-            sleep(5)
+            self.assertTrue(self.token_provider._refreshed.wait(10))
+            self.token_provider._refreshed.clear()
             # The new signature string should be cached.
             self.assertNotEqual(
                 auth_string,
                 self.token_provider.get_authorization_string(self.request))
 
-        def testAccessTokenProviderGetRegion(self):
-            # no region
-            config = oci.config.from_file(file_location=fake_credentials_file)
-            provider = oci.signer.Signer(
-                config['tenancy'], config['user'], config['fingerprint'],
-                config['key_file'], config.get('pass_phrase'),
-                config.get('key_content'))
-            self.token_provider = SignatureProvider(provider)
-            self.assertIsNone(self.token_provider.get_region())
-            self.token_provider.close()
-            # region get from provider parameter of constructor
-            provider.region = config['region']
-            self.token_provider = SignatureProvider(provider)
-            self.assertEqual(self.token_provider.get_region(),
-                             Regions.US_ASHBURN_1)
-            self.token_provider.close()
-            # region get from config_file parameter of constructor
-            self.token_provider = SignatureProvider(
-                config_file=fake_credentials_file)
-            self.assertEqual(self.token_provider.get_region(),
-                             Regions.US_ASHBURN_1)
-            self.token_provider.close()
-            # region from region parameter of constructor
-            self.token_provider = SignatureProvider(
-                tenant_id='ocid1.tenancy.oc1..tenancy',
-                user_id='ocid1.user.oc1..user', fingerprint='fingerprint',
-                private_key=fake_key_file, region=Regions.US_ASHBURN_1,
-                duration_seconds=5, refresh_ahead=1)
+        def testInstancePrincipalGetRegion(self):
+            self.token_provider = (
+                SignatureProvider.create_with_instance_principal(
+                    region=Regions.US_ASHBURN_1))
             self.assertEqual(self.token_provider.get_region(),
                              Regions.US_ASHBURN_1)
 
-        if iam_principal() == 'instance principal':
-            def testInstancePrincipalGetAuthString(self):
-                signer = (
-                    oci.auth.signers.InstancePrincipalsSecurityTokenSigner())
-                self.token_provider = SignatureProvider(
-                    signer, duration_seconds=5, refresh_ahead=1)
-                self.assertRaises(
-                    IllegalArgumentException,
-                    self.token_provider.get_authorization_string, self.request)
-                self.token_provider.set_service_url(self.handle_config)
-                auth_string = self.token_provider.get_authorization_string(
-                    self.request)
-                # Cache duration is about 5s, string should be the same.
-                self.assertEqual(
-                    auth_string,
-                    self.token_provider.get_authorization_string(self.request))
-                # Wait for the refresh to complete.
-                sleep(5)
-                # The new signature string should be cached.
-                self.assertNotEqual(
-                    auth_string,
-                    self.token_provider.get_authorization_string(self.request))
-
-            def testInstancePrincipalGetRegion(self):
-                self.token_provider = (
-                    SignatureProvider.create_with_instance_principal(
-                        region=Regions.US_ASHBURN_1))
-                self.assertEqual(self.token_provider.get_region(),
-                                 Regions.US_ASHBURN_1)
-
-        @staticmethod
-        def _generate_credentials_file():
-            # Generate credentials file
-            if path.exists(fake_credentials_file):
-                remove(fake_credentials_file)
+    @staticmethod
+    def _generate_credentials_file():
+        # Generate credentials file
+        if path.exists(fake_credentials_file):
+            remove(fake_credentials_file)
 
-            with open(fake_credentials_file, 'w') as cred_file:
-                cred_file.write('[DEFAULT]\n')
-                cred_file.write('tenancy=ocid1.tenancy.oc1..tenancy\n')
-                cred_file.write('user=ocid1.user.oc1..user\n')
-                cred_file.write('fingerprint=fingerprint\n')
-                cred_file.write('key_file=' + fake_key_file + '\n')
-                cred_file.write('region=us-ashburn-1\n')
+        with open(fake_credentials_file, 'w') as cred_file:
+            cred_file.write(_CRED_BODY)
 
 
 if __name__ == '__main__':